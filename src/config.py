@@ -31,7 +31,8 @@ class Config:
     CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', '3600'))  # 1 hour cache
     
     # Fruityvice API Configuration
-    FRUITYVICE_API_URL = 'https://fruityvice.com/api/fruit'
+    FRUITYVICE_API_URL = os.getenv('FRUITYVICE_API_URL', 'https://fruityvice.com/api/fruit')
+    FRUITYVICE_TIMEOUT = float(os.getenv('FRUITYVICE_TIMEOUT', '10'))  # seconds
     
     # Display Layout Configuration
     LAYOUT_CONFIG = {
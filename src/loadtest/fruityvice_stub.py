@@ -0,0 +1,217 @@
+'''Local stand-in for the Fruityvice API.
+
+Serves ``/api/fruit/all`` and ``/api/fruit/<id>`` from a generated catalog so
+the plugin can be exercised under load without calling fruityvice.com. Point
+the plugin at it with ``FRUITYVICE_API_URL=http://localhost:5050/api/fruit``.
+
+Run with::
+
+    python -m src.loadtest.fruityvice_stub --catalog-size 500 --latency-ms 80
+'''
+import argparse
+import json
+import logging
+import random
+import time
+from threading import Lock
+from typing import Dict, Any, List, Optional
+
+from flask import Flask, Response, jsonify
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_FRUITS = [
+    ('Apple', 'Rosaceae', 'Rosales', 'Malus'),
+    ('Banana', 'Musaceae', 'Zingiberales', 'Musa'),
+    ('Cherry', 'Rosaceae', 'Rosales', 'Prunus'),
+    ('Lemon', 'Rutaceae', 'Sapindales', 'Citrus'),
+    ('Mango', 'Anacardiaceae', 'Sapindales', 'Mangifera'),
+    ('Kiwi', 'Actinidiaceae', 'Ericales', 'Actinidia'),
+    ('Pineapple', 'Bromeliaceae', 'Poales', 'Ananas'),
+    ('Strawberry', 'Rosaceae', 'Rosales', 'Fragaria'),
+    ('Blueberry', 'Ericaceae', 'Ericales', 'Vaccinium'),
+    ('Grape', 'Vitaceae', 'Vitales', 'Vitis'),
+]
+
+
+def generate_catalog(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    '''Generate a Fruityvice-shaped fruit catalog.
+
+    Args:
+        size: Number of fruits to generate
+        seed: Seed for the nutrition values, so runs are reproducible
+
+    Returns:
+        List of fruit dictionaries matching the Fruityvice schema
+    '''
+    rng = random.Random(seed)
+    catalog = []
+    for index in range(size):
+        name, family, order, genus = SAMPLE_FRUITS[index % len(SAMPLE_FRUITS)]
+        if index >= len(SAMPLE_FRUITS):
+            name = f'{name} {index // len(SAMPLE_FRUITS) + 1}'
+        catalog.append({
+            'name': name,
+            'id': index + 1,
+            'family': family,
+            'order': order,
+            'genus': genus,
+            'nutritions': {
+                'calories': rng.randint(15, 160),
+                'fat': round(rng.uniform(0, 2), 1),
+                'sugar': round(rng.uniform(0, 25), 1),
+                'carbohydrates': round(rng.uniform(2, 35), 1),
+                'protein': round(rng.uniform(0, 3), 1)
+            }
+        })
+    return catalog
+
+
+class StubStats:
+    '''Thread-safe counters for calls made against the stub.'''
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        '''Zero all counters.'''
+        with self._lock:
+            self.calls = {'all': 0, 'by_id': 0}
+            self.failures = 0
+            self.bytes_sent = 0
+
+    def record(self, endpoint: str, size: int, failed: bool = False) -> None:
+        '''Record a single upstream call.'''
+        with self._lock:
+            self.calls[endpoint] += 1
+            self.bytes_sent += size
+            if failed:
+                self.failures += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        '''Return a copy of the current counters.'''
+        with self._lock:
+            return {
+                'calls': dict(self.calls),
+                'total_calls': sum(self.calls.values()),
+                'failures': self.failures,
+                'bytes_sent': self.bytes_sent
+            }
+
+
+def create_stub_app(
+    catalog_size: int = 50,
+    latency_ms: float = 0,
+    jitter_ms: float = 0,
+    failure_rate: float = 0.0,
+    seed: int = 0
+) -> Flask:
+    '''Create the Fruityvice stub application.
+
+    Args:
+        catalog_size: Number of fruits served by ``/api/fruit/all``
+        latency_ms: Base delay added to every fruit response
+        jitter_ms: Maximum random delay added on top of ``latency_ms``
+        failure_rate: Fraction of fruit requests answered with HTTP 503
+        seed: Seed for catalog generation and failure injection
+
+    Returns:
+        Flask app exposing the stub endpoints plus ``/__stats``
+    '''
+    if catalog_size < 0:
+        raise ValueError('catalog_size must not be negative')
+    if latency_ms < 0:
+        raise ValueError('latency_ms must not be negative')
+    if jitter_ms < 0:
+        raise ValueError('jitter_ms must not be negative')
+    if not 0.0 <= failure_rate <= 1.0:
+        raise ValueError('failure_rate must be between 0 and 1')
+
+    app = Flask(__name__)
+    catalog = generate_catalog(catalog_size, seed)
+    fruits_by_id = {fruit['id']: fruit for fruit in catalog}
+    all_payload = json.dumps(catalog)
+    stats = StubStats()
+    rng = random.Random(seed)
+    rng_lock = Lock()
+
+    app.config['STUB_STATS'] = stats
+
+    def _delay_and_maybe_fail() -> bool:
+        with rng_lock:
+            delay = latency_ms + rng.uniform(0, jitter_ms)
+            failed = rng.random() < failure_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return failed
+
+    def _respond(endpoint: str, body: Optional[str], status: int = 200) -> Response:
+        if body is None:
+            body = json.dumps({'error': 'Service unavailable'})
+            status = 503
+        response = Response(body, status=status, mimetype='application/json')
+        stats.record(endpoint, len(response.get_data()), failed=status >= 500)
+        return response
+
+    @app.route('/api/fruit/all')
+    def all_fruits():
+        if _delay_and_maybe_fail():
+            return _respond('all', None)
+        return _respond('all', all_payload)
+
+    @app.route('/api/fruit/<int:fruit_id>')
+    def fruit_by_id(fruit_id: int):
+        if _delay_and_maybe_fail():
+            return _respond('by_id', None)
+        fruit = fruits_by_id.get(fruit_id)
+        if fruit is None:
+            return _respond('by_id', json.dumps({'error': 'Not found'}), status=404)
+        return _respond('by_id', json.dumps(fruit))
+
+    @app.route('/__stats', methods=['GET'])
+    def get_stats():
+        return jsonify(stats.snapshot())
+
+    @app.route('/__stats', methods=['DELETE'])
+    def reset_stats():
+        stats.reset()
+        return jsonify(stats.snapshot())
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Local Fruityvice API stand-in')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=5050)
+    parser.add_argument('--catalog-size', type=int, default=50)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    try:
+        app = create_stub_app(
+            catalog_size=args.catalog_size,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            failure_rate=args.failure_rate,
+            seed=args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    logger.info(
+        f'Serving {args.catalog_size} fruits at '
+        f'http://{args.host}:{args.port}/api/fruit'
+    )
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == '__main__':
+    main()
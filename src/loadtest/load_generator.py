@@ -0,0 +1,348 @@
+'''Fleet load generator for the TRMNL webhook.
+
+Simulates a fleet of TRMNL devices polling ``/webhook``. Each device waits for
+the number of seconds given in the ``X-TRMNL-Refresh`` header of its previous
+response before polling again. Because real refresh intervals are measured in
+minutes or hours, ``--time-scale`` shrinks every wait (0.001 turns a one hour
+refresh into 3.6 seconds).
+
+Run against the plugin backed by the local Fruityvice stub::
+
+    python -m src.loadtest.fruityvice_stub --port 5050 &
+    FRUITYVICE_API_URL=http://localhost:5050/api/fruit python -m src.app &
+    python -m src.loadtest.load_generator --devices 2000 --duration 60 \\
+        --time-scale 0.001 --stub-url http://localhost:5050
+'''
+import argparse
+import heapq
+import logging
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Lock, local
+from typing import Dict, Any, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH = 300  # Seconds a device waits when no refresh header is sent
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    '''Return the nearest-rank percentile of a list of values.
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or None if there are no samples
+    '''
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LoadGenerator:
+    '''Drives a simulated device fleet against the webhook endpoint.'''
+
+    def __init__(
+        self,
+        target_url: str,
+        devices: int = 1000,
+        duration: float = 60,
+        time_scale: float = 0.001,
+        ramp_up: Optional[float] = None,
+        concurrency: int = 64,
+        timeout: float = 30,
+        stub_url: Optional[str] = None,
+        seed: Optional[int] = None
+    ):
+        if ramp_up is None:
+            ramp_up = duration / 4
+        if devices < 1:
+            raise ValueError('devices must be at least 1')
+        if duration <= 0:
+            raise ValueError('duration must be positive')
+        if time_scale <= 0:
+            raise ValueError('time_scale must be positive')
+        if not 0 <= ramp_up <= duration:
+            raise ValueError('ramp_up must be between 0 and duration')
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        if timeout <= 0:
+            raise ValueError('timeout must be positive')
+
+        self.target_url = target_url.rstrip('/')
+        self.devices = devices
+        self.duration = duration
+        self.time_scale = time_scale
+        self.ramp_up = ramp_up
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.stub_url = stub_url.rstrip('/') if stub_url else None
+        self._rng = random.Random(seed)
+
+        self._schedule = []
+        self._schedule_cv = Condition()
+        self._results_lock = Lock()
+        self._sessions = local()
+        self._reset_results()
+
+    def _reset_results(self) -> None:
+        self._requests = 0
+        self._latencies = []
+        self._lags = []
+        self._status_codes = {}
+        self._errors = 0
+        self._bytes_received = 0
+        self._late = 0
+        self._dropped = 0
+
+    def run(self) -> Dict[str, Any]:
+        '''Run the load test and return a report dictionary.'''
+        self._reset_results()
+        upstream_before = self._fetch_upstream_stats()
+
+        start = time.monotonic()
+        deadline = start + self.duration
+        with self._schedule_cv:
+            self._schedule = [
+                (start + self._rng.uniform(0, self.ramp_up), device_id)
+                for device_id in range(self.devices)
+            ]
+            heapq.heapify(self._schedule)
+
+        submitted = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                with self._schedule_cv:
+                    while True:
+                        now = time.monotonic()
+                        if now >= deadline:
+                            break
+                        if self._schedule and self._schedule[0][0] <= now:
+                            due, device_id = heapq.heappop(self._schedule)
+                            break
+                        wait = deadline - now
+                        if self._schedule:
+                            wait = min(wait, self._schedule[0][0] - now)
+                        self._schedule_cv.wait(wait)
+                if now >= deadline:
+                    break
+                submitted.append(
+                    (executor.submit(self._poll, device_id, due, deadline), due)
+                )
+            # Measure up to the deadline; polls still running are reported as late
+            elapsed = now - start
+            # Drop polls still queued behind a saturated server
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        dropped = [due for future, due in submitted if future.cancelled()]
+        with self._results_lock:
+            self._dropped = len(dropped)
+            # Dropped polls waited at least until the deadline without starting
+            self._lags.extend(deadline - due for due in dropped)
+
+        upstream_after = self._fetch_upstream_stats()
+        return self._build_report(elapsed, upstream_before, upstream_after)
+
+    def _poll(self, device_id: int, due: float, deadline: float) -> None:
+        '''Poll the webhook once for a device and schedule its next poll.'''
+        started = time.monotonic()
+        refresh = DEFAULT_REFRESH
+        status = None
+        size = 0
+        try:
+            response = self._session().get(
+                f'{self.target_url}/webhook', timeout=self.timeout
+            )
+            status = response.status_code
+            size = len(response.content)
+            refresh = int(response.headers.get('X-TRMNL-Refresh', DEFAULT_REFRESH))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f'Device {device_id} poll failed: {str(e)}')
+        finished = time.monotonic()
+
+        with self._results_lock:
+            # Late polls stay in the latency samples so the tail is not hidden
+            self._latencies.append(finished - started)
+            self._lags.append(started - due)
+            if finished > deadline:
+                self._late += 1
+                return
+            self._requests += 1
+            self._bytes_received += size
+            if status is None:
+                self._errors += 1
+            else:
+                self._status_codes[status] = self._status_codes.get(status, 0) + 1
+
+        next_due = finished + max(refresh, 1) * self.time_scale
+        if next_due < deadline:
+            with self._schedule_cv:
+                heapq.heappush(self._schedule, (next_due, device_id))
+                self._schedule_cv.notify()
+
+    def _session(self) -> requests.Session:
+        '''Return a per-thread HTTP session for connection reuse.'''
+        session = getattr(self._sessions, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._sessions.session = session
+        return session
+
+    def _fetch_upstream_stats(self) -> Optional[Dict[str, Any]]:
+        '''Fetch call counters from the Fruityvice stub, if configured.'''
+        if not self.stub_url:
+            return None
+        try:
+            response = requests.get(f'{self.stub_url}/__stats', timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f'Failed to fetch stub stats: {str(e)}')
+            return None
+
+    def _build_report(
+        self,
+        elapsed: float,
+        upstream_before: Optional[Dict[str, Any]],
+        upstream_after: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        '''Summarise collected samples into a report.'''
+        with self._results_lock:
+            latencies = list(self._latencies)
+            lags = list(self._lags)
+            requests_sent = self._requests
+            report = {
+                'devices': self.devices,
+                'duration': round(elapsed, 3),
+                'requests': requests_sent,
+                'throughput': round(requests_sent / elapsed, 2) if elapsed else 0.0,
+                'errors': self._errors,
+                'late': self._late,
+                'dropped': self._dropped,
+                'status_codes': dict(sorted(self._status_codes.items())),
+                'bytes_served': self._bytes_received,
+                'latency_ms': {
+                    f'p{pct}': _to_ms(percentile(latencies, pct))
+                    for pct in (50, 90, 95, 99)
+                },
+                'schedule_lag_ms': {
+                    f'p{pct}': _to_ms(percentile(lags, pct)) for pct in (50, 99)
+                },
+                'upstream': None
+            }
+        report['latency_ms']['max'] = _to_ms(max(latencies) if latencies else None)
+
+        if upstream_before and upstream_after:
+            report['upstream'] = {
+                'calls': {
+                    endpoint: upstream_after['calls'][endpoint]
+                    - upstream_before['calls'].get(endpoint, 0)
+                    for endpoint in upstream_after['calls']
+                },
+                'total_calls': upstream_after['total_calls'] - upstream_before['total_calls'],
+                'failures': upstream_after['failures'] - upstream_before['failures'],
+                'bytes_sent': upstream_after['bytes_sent'] - upstream_before['bytes_sent']
+            }
+        return report
+
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    '''Format a load test report for the terminal.
+
+    Args:
+        report: Report returned by ``LoadGenerator.run``
+
+    Returns:
+        Human-readable multi-line summary
+    '''
+    latency = report['latency_ms']
+    lag = report['schedule_lag_ms']
+    lines = [
+        '=' * 80,
+        'TRMNL Fruit Facts Load Test',
+        '=' * 80,
+        f"Devices:          {report['devices']}",
+        f"Duration:         {report['duration']}s",
+        f"Requests:         {report['requests']} ({report['errors']} connection errors)",
+        f"Late responses:   {report['late']} (still running at the deadline)",
+        f"Dropped polls:    {report['dropped']} (queued but never sent)",
+        f"Throughput:       {report['throughput']} req/s",
+        f"Status codes:     {report['status_codes']}",
+        f"Bytes served:     {report['bytes_served']}",
+        '-' * 80,
+        'Latency (ms):     ' + ', '.join(f'{key}={value}' for key, value in latency.items())
+        + ' (incl. late responses)',
+        'Schedule lag (ms): ' + ', '.join(f'{key}={value}' for key, value in lag.items())
+        + ' (incl. dropped polls)',
+    ]
+    upstream = report.get('upstream')
+    if upstream:
+        lines += [
+            '-' * 80,
+            f"Upstream calls:   {upstream['total_calls']} {upstream['calls']}",
+            f"Upstream failures: {upstream['failures']}",
+            f"Upstream bytes:   {upstream['bytes_sent']}",
+        ]
+    lines.append('=' * 80)
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='TRMNL webhook fleet load generator')
+    parser.add_argument('--target-url', default='http://localhost:5000')
+    parser.add_argument('--devices', type=int, default=1000)
+    parser.add_argument('--duration', type=float, default=60, help='Test length in seconds')
+    parser.add_argument(
+        '--time-scale',
+        type=float,
+        default=0.001,
+        help='Multiplier applied to X-TRMNL-Refresh intervals'
+    )
+    parser.add_argument(
+        '--ramp-up',
+        type=float,
+        default=None,
+        help='Window over which first polls are spread (default: duration / 4)'
+    )
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--stub-url', default=None, help='Fruityvice stub base URL')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    try:
+        generator = LoadGenerator(
+            target_url=args.target_url,
+            devices=args.devices,
+            duration=args.duration,
+            time_scale=args.time_scale,
+            ramp_up=args.ramp_up,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            stub_url=args.stub_url,
+            seed=args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    logger.info(f'Simulating {args.devices} devices against {args.target_url}')
+    print(format_report(generator.run()))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,9 +10,8 @@ logger = logging.getLogger(__name__)
 class APIService:
     '''Service for handling Fruityvice API interactions.'''
     
-    BASE_URL = 'https://fruityvice.com/api/fruit'
-    
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
+        self.base_url = (base_url or Config.FRUITYVICE_API_URL).rstrip('/')
         self.last_update = None
         self._cached_data = None
         self._cache_timestamp = None
@@ -60,7 +59,7 @@ class APIService:
     def _fetch_all_fruits(self) -> List[Dict[str, Any]]:
         '''Fetch all fruits from the API.'''
         try:
-            response = requests.get(f"{self.BASE_URL}/all")
+            response = requests.get(f"{self.base_url}/all", timeout=Config.FRUITYVICE_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -70,7 +69,9 @@ class APIService:
     def _fetch_fruit_by_id(self, fruit_id: int) -> Optional[Dict[str, Any]]:
         '''Fetch a specific fruit by ID.'''
         try:
-            response = requests.get(f"{self.BASE_URL}/{fruit_id}")
+            response = requests.get(
+                f"{self.base_url}/{fruit_id}", timeout=Config.FRUITYVICE_TIMEOUT
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1,5 +1,7 @@
 from datetime import datetime, UTC
+from unittest.mock import patch
 import pytest
+from src.config import Config
 from src.services.display import DisplayGenerator
 from src.services.api_service import APIService
 
@@ -26,6 +28,26 @@ def test_api_service():
     assert 'timestamp' in data
     assert 'status' in data
 
+def test_api_service_base_url():
+    '''Test APIService sends requests to a configured base URL'''
+    service = APIService(base_url='http://stub/api/fruit/')
+    assert service.base_url == 'http://stub/api/fruit'
+    assert APIService().base_url == Config.FRUITYVICE_API_URL.rstrip('/')
+
+    with patch('src.services.api_service.requests.get') as mock_get:
+        mock_get.return_value.json.return_value = [{'id': 1}]
+        assert service._fetch_all_fruits() == [{'id': 1}]
+        mock_get.assert_called_once_with(
+            'http://stub/api/fruit/all', timeout=Config.FRUITYVICE_TIMEOUT
+        )
+
+        mock_get.reset_mock()
+        mock_get.return_value.json.return_value = {'id': 3}
+        assert service._fetch_fruit_by_id(3) == {'id': 3}
+        mock_get.assert_called_once_with(
+            'http://stub/api/fruit/3', timeout=Config.FRUITYVICE_TIMEOUT
+        )
+
 def test_display_creation():
     '''Test display creation with mock data'''
     display = DisplayGenerator(800, 480)
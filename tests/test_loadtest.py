@@ -0,0 +1,236 @@
+import socket
+import time
+from contextlib import contextmanager
+from threading import Thread
+import pytest
+import requests
+from flask import Flask, Response
+from werkzeug.serving import make_server
+from src.loadtest.fruityvice_stub import create_stub_app, generate_catalog
+from src.loadtest.load_generator import LoadGenerator, percentile
+
+@contextmanager
+def serve(app):
+    '''Serve a Flask app on a free local port for the duration of a test'''
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        thread.join()
+
+def create_webhook_app(stub_url, refresh):
+    '''Create a minimal plugin that hits the stub once per webhook poll'''
+    app = Flask(__name__)
+
+    @app.route('/webhook')
+    def webhook():
+        requests.get(f'{stub_url}/api/fruit/all', timeout=5)
+        return Response(b'x' * 100, headers={'X-TRMNL-Refresh': str(refresh)})
+
+    return app
+
+def test_generate_catalog():
+    '''Test catalog generation matches the Fruityvice schema'''
+    catalog = generate_catalog(25, seed=1)
+    assert len(catalog) == 25
+    assert len({fruit['name'] for fruit in catalog}) == 25
+    assert catalog == generate_catalog(25, seed=1)
+    assert set(catalog[0]['nutritions']) == {
+        'calories', 'fat', 'sugar', 'carbohydrates', 'protein'
+    }
+
+def test_stub_endpoints():
+    '''Test stub serves fruits and counts upstream calls'''
+    client = create_stub_app(catalog_size=5).test_client()
+    assert len(client.get('/api/fruit/all').get_json()) == 5
+    assert client.get('/api/fruit/3').get_json()['id'] == 3
+    assert client.get('/api/fruit/99').status_code == 404
+
+    stats = client.get('/__stats').get_json()
+    assert stats['calls'] == {'all': 1, 'by_id': 2}
+    assert stats['bytes_sent'] > 0
+
+def test_stub_failure_rate():
+    '''Test stub injects failures'''
+    client = create_stub_app(catalog_size=5, failure_rate=1.0).test_client()
+    assert client.get('/api/fruit/all').status_code == 503
+    assert client.get('/__stats').get_json()['failures'] == 1
+
+@pytest.mark.parametrize('kwargs', [
+    {'catalog_size': -1},
+    {'latency_ms': -1},
+    {'jitter_ms': -1},
+    {'failure_rate': -0.1},
+    {'failure_rate': 1.5}
+])
+def test_stub_rejects_invalid_arguments(kwargs):
+    '''Test stub rejects invalid arguments'''
+    with pytest.raises(ValueError):
+        create_stub_app(**kwargs)
+
+def test_percentile():
+    '''Test nearest-rank percentile'''
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 50) is None
+
+@pytest.mark.parametrize('kwargs', [
+    {'devices': 0},
+    {'duration': 0},
+    {'time_scale': 0},
+    {'time_scale': -1},
+    {'duration': 10, 'ramp_up': 20},
+    {'ramp_up': -1},
+    {'concurrency': 0},
+    {'timeout': 0}
+])
+def test_load_generator_rejects_invalid_arguments(kwargs):
+    '''Test LoadGenerator rejects invalid arguments'''
+    with pytest.raises(ValueError):
+        LoadGenerator('http://localhost:5000', **kwargs)
+
+def test_load_generator_run():
+    '''Test devices re-poll on X-TRMNL-Refresh and upstream calls are counted'''
+    with serve(create_stub_app(catalog_size=5)) as stub_url:
+        with serve(create_webhook_app(stub_url, refresh=10)) as target_url:
+            report = LoadGenerator(
+                target_url,
+                devices=5,
+                duration=1,
+                time_scale=0.01,
+                stub_url=stub_url,
+                seed=1
+            ).run()
+
+    # Each device polls within the ramp-up, then every 0.1 seconds
+    assert 5 < report['requests'] <= 5 * 11
+    assert report['errors'] == 0
+    assert report['status_codes'] == {200: report['requests']}
+    assert report['bytes_served'] == 100 * report['requests']
+    assert report['duration'] == pytest.approx(1, abs=0.1)
+    assert set(report['latency_ms']) == {'p50', 'p90', 'p95', 'p99', 'max'}
+    assert report['latency_ms']['p50'] <= report['latency_ms']['max']
+    assert report['upstream']['total_calls'] == report['requests'] + report['late']
+    assert report['upstream']['calls']['all'] == report['upstream']['total_calls']
+
+def test_load_generator_drops_polls_after_deadline():
+    '''Test devices whose next refresh falls after the deadline poll once'''
+    with serve(create_stub_app(catalog_size=5)) as stub_url:
+        with serve(create_webhook_app(stub_url, refresh=100)) as target_url:
+            report = LoadGenerator(
+                target_url, devices=5, duration=1, time_scale=0.01
+            ).run()
+
+    assert report['requests'] == 5
+    assert report['upstream'] is None
+
+def test_load_generator_counts_dropped_polls():
+    '''Test polls still queued at the deadline are reported as dropped'''
+    app = Flask(__name__)
+
+    @app.route('/webhook')
+    def webhook():
+        time.sleep(0.1)
+        return Response(b'x', headers={'X-TRMNL-Refresh': '1000'})
+
+    with serve(app) as target_url:
+        report = LoadGenerator(
+            target_url,
+            devices=20,
+            duration=0.5,
+            time_scale=0.01,
+            ramp_up=0,
+            concurrency=1
+        ).run()
+
+    # Every device is due once; a single worker cannot serve them all in time
+    assert report['requests'] + report['late'] + report['dropped'] == 20
+    assert report['dropped'] > 0
+    assert report['schedule_lag_ms']['p99'] >= 400
+
+def test_load_generator_keeps_late_poll_latency():
+    '''Test polls finishing after the deadline still count toward latency'''
+    app = Flask(__name__)
+
+    @app.route('/webhook')
+    def webhook():
+        time.sleep(0.1)
+        return Response(b'x', headers={'X-TRMNL-Refresh': '1000'})
+
+    generator = LoadGenerator('http://localhost:5000', devices=1, duration=1)
+    with serve(app) as target_url:
+        generator.target_url = target_url
+        now = time.monotonic()
+        generator._poll(0, due=now, deadline=now + 0.05)
+
+    report = generator._build_report(1.0, None, None)
+    assert report['requests'] == 0
+    assert report['late'] == 1
+    assert report['status_codes'] == {}
+    assert report['latency_ms']['max'] >= 100
+
+def test_load_generator_counts_connection_errors():
+    '''Test failed polls are counted as errors'''
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    report = LoadGenerator(
+        f'http://127.0.0.1:{port}', devices=3, duration=0.5, time_scale=0.01
+    ).run()
+
+    # Failed devices wait the default 300 second refresh, past the deadline
+    assert report['requests'] == 3
+    assert report['errors'] == 3
+    assert report['status_codes'] == {}
+    assert report['bytes_served'] == 0
+
+def test_build_report():
+    '''Test report summarises samples and upstream stat differences'''
+    generator = LoadGenerator('http://localhost:5000', devices=2, duration=2)
+    generator._requests = 2
+    generator._latencies = [0.1, 0.2, 0.3, 0.4]
+    generator._lags = [0.0, 0.01, 0.02, 0.03]
+    generator._status_codes = {200: 1, 500: 1}
+    generator._bytes_received = 4000
+    generator._late = 2
+    generator._dropped = 3
+    before = {
+        'calls': {'all': 2, 'by_id': 1},
+        'total_calls': 3,
+        'failures': 1,
+        'bytes_sent': 500
+    }
+    after = {
+        'calls': {'all': 5, 'by_id': 1},
+        'total_calls': 6,
+        'failures': 2,
+        'bytes_sent': 800
+    }
+
+    report = generator._build_report(2.0, before, after)
+    assert report['requests'] == 2
+    assert report['throughput'] == 1.0
+    assert report['status_codes'] == {200: 1, 500: 1}
+    assert report['bytes_served'] == 4000
+    assert report['late'] == 2
+    assert report['dropped'] == 3
+    assert report['latency_ms'] == {
+        'p50': 200.0, 'p90': 400.0, 'p95': 400.0, 'p99': 400.0, 'max': 400.0
+    }
+    assert report['schedule_lag_ms'] == {'p50': 10.0, 'p99': 30.0}
+    assert report['upstream'] == {
+        'calls': {'all': 3, 'by_id': 0},
+        'total_calls': 3,
+        'failures': 1,
+        'bytes_sent': 300
+    }
+
+    # A failed stats fetch on either side leaves upstream unreported
+    assert generator._build_report(2.0, before, None)['upstream'] is None
+    assert generator._build_report(2.0, None, after)['upstream'] is None